@@ -1,49 +1,113 @@
+# NOTE: keep the top-level imports of this module light, it is loaded by the `jina` console
+# script on every invocation, including `jina --help`. Import anything heavier inside functions.
 import os
 import sys
+from functools import lru_cache
+
+_UNDERSCORE_TO_DASH = str.maketrans('_', '-')
+
+# `cli` is installed next to `jina`, so the logo can be located without importing `jina`
+_LOGO_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'jina',
+    'resources',
+    'jina.logo',
+)
+
+
+@lru_cache()
+def _load_logo() -> str:
+    """Read the Jina logo once and keep it for the later calls.
+
+    :return: the logo as a string
+    """
+    with open(_LOGO_PATH) as fp:
+        return fp.read()
+
+
+def _sniff_subcommand():
+    """Find the sub-command in `sys.argv` without building any parser.
+
+    :return: the first non-flag token in `sys.argv`, or None if there is none
+    """
+    for a in sys.argv[1:]:
+        if not a.startswith('-'):
+            return a
+
+
+def _print_quick_help():
+    """Print the top-level usage of `jina` without building any parser."""
+    # read from the autocomplete table, importing `jina.parsers` would import all of `jina`
+    from .autocomplete import ac_table
+
+    sub_commands = [c for c in ac_table['commands'] if not c.startswith('-')]
+    print(
+        f'usage: jina [-h] [-v] [-vf] {{{",".join(sub_commands)}}} ...\n\n'
+        'Use `jina [sub-command] --help` to get detailed information about each sub-command.\n'
+        'Use `jina --help` to show the full help.'
+    )
 
 
 def _get_run_args(print_args: bool = True):
+    if len(sys.argv) == 1:
+        _print_quick_help()
+        exit()
+
     from jina.parsers import get_main_parser
 
     silent_print = {'help', 'hub'}
 
-    parser = get_main_parser()
-    if len(sys.argv) > 1:
-        from argparse import _StoreAction, _StoreTrueAction
+    parser = get_main_parser(only=_sniff_subcommand())
+    args, unknown = parser.parse_known_args()
 
-        args, unknown = parser.parse_known_args()
+    if unknown:
+        from jina.helper import warn_unknown_args
 
-        if unknown:
-            from jina.helper import warn_unknown_args
+        warn_unknown_args(unknown)
 
-            warn_unknown_args(unknown)
+    if args.cli not in silent_print and print_args:
+        import logging
+        from jina.logging.predefined import default_logger
 
-        if args.cli not in silent_print and print_args:
+        if not default_logger.logger.isEnabledFor(logging.INFO):
+            return args
+
+        from argparse import _StoreAction, _StoreTrueAction
+
+        p = parser._actions[-1].choices[sys.argv[1]]
+        default_args = {
+            a.dest: a.default
+            for a in p._actions
+            if isinstance(a, (_StoreAction, _StoreTrueAction))
+        }
+
+        logo_str = _load_logo()
+        if sys.stdout.isatty():
             from jina.helper import colored
-            from jina import __resources_path__
-
-            p = parser._actions[-1].choices[sys.argv[1]]
-            default_args = {
-                a.dest: a.default
-                for a in p._actions
-                if isinstance(a, (_StoreAction, _StoreTrueAction))
-            }
-
-            with open(os.path.join(__resources_path__, 'jina.logo')) as fp:
-                logo_str = fp.read()
-            param_str = []
-            for k, v in sorted(vars(args).items()):
-                j = f'{k.replace("_", "-"): >30.30} = {str(v):30.30}'
-                if default_args.get(k, None) == v:
-                    param_str.append('   ' + j)
-                else:
-                    param_str.append('🔧️ ' + colored(j, 'blue', 'on_yellow'))
-            param_str = '\n'.join(param_str)
-            print(f'\n{logo_str}\n▶️  {" ".join(sys.argv)}\n{param_str}\n')
-        return args
-    else:
-        parser.print_help()
-        exit()
+
+            # the highlight is the same for every changed arg, compute its escape codes once
+            c_prefix, c_suffix = colored('\0', 'blue', 'on_yellow').split('\0')
+        else:
+            # no terminal to render the highlight, e.g. CI or container logs
+            c_prefix = c_suffix = ''
+
+        a = vars(args)
+
+        def _fmt(k):
+            v = a[k]
+            j = f'{k.translate(_UNDERSCORE_TO_DASH): >30.30} = {v!s:30.30}'
+            if default_args.get(k) == v:
+                return '   ' + j
+            return '🔧️ ' + c_prefix + j + c_suffix
+
+        param_str = '\n'.join(_fmt(k) for k in sorted(a) if not k.startswith('_'))
+
+        import shlex
+
+        # same as `shlex.join`, which is not available on Python 3.7
+        cmdline = ' '.join(shlex.quote(t) for t in sys.argv)
+        print(f'\n{logo_str}\n▶️  {cmdline}\n{param_str}\n')
+    return args
 
 
 def _quick_ac_lookup():
@@ -104,13 +168,14 @@ def main():
     """The main entrypoint of the CLI """
     _quick_ac_lookup()
 
-    from . import api
-
     args = _get_run_args()
 
+    # imported only after parsing, so `--help`, `--version` and bare `jina` exit without it
+    from . import api
+
     # checking version info in another thread
     import threading
 
     threading.Thread(target=_is_latest_version, daemon=True).start()
 
-    getattr(api, args.cli.replace('-', '_'))(args)
+    getattr(api, args._api_func_name)(args)
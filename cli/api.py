@@ -1,3 +1,8 @@
+"""Handlers of the `jina` sub-commands, dispatched by name from :func:`cli.main`.
+
+Every handler imports what it needs inside its own body, so importing this module stays cheap and
+running one sub-command only loads the dependencies of that sub-command.
+"""
 if False:
     from argparse import Namespace
 
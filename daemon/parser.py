@@ -1,8 +1,9 @@
 import argparse
+import logging
 import os
 import sys
 
-from jina import __resources_path__, __default_host__
+from jina import __default_host__
 from jina.parsers.base import set_base_parser
 from jina.parsers.helper import add_arg_group, _SHOW_ALL_ARGS
 from jina.parsers.peapods.base import mixin_base_ppr_parser
@@ -97,15 +98,17 @@ def _get_run_args(print_args: bool = True):
     :param print_args: True if we want to print args to console
     :return: jinad args
     """
-    from jina.helper import colored
-    from . import daemon_logger
-
     parser = get_main_parser()
-    from argparse import _StoreAction, _StoreTrueAction
 
     args, argv = parser.parse_known_args()
     # avoid printing for partial daemon (args.mode is set)
     if print_args and args.mode is None:
+        from . import daemon_logger
+
+        if not daemon_logger.logger.isEnabledFor(logging.INFO):
+            return args
+
+        from argparse import _StoreAction, _StoreTrueAction
 
         default_args = {
             a.dest: a.default
@@ -113,8 +116,10 @@ def _get_run_args(print_args: bool = True):
             if isinstance(a, (_StoreAction, _StoreTrueAction))
         }
 
-        with open(os.path.join(__resources_path__, 'jina.logo')) as fp:
-            logo_str = fp.read()
+        from jina.helper import colored
+        from cli import _load_logo
+
+        logo_str = _load_logo()
         param_str = []
         for k, v in sorted(vars(args).items()):
             j = f'{k.replace("_", "-"): >30.30} = {str(v):30.30}'
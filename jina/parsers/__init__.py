@@ -1,4 +1,5 @@
 import argparse
+from typing import Optional
 
 from jina.parsers.client import mixin_comm_protocol_parser
 from .helper import _SHOW_ALL_ARGS
@@ -148,9 +149,10 @@ def set_help_parser(parser=None):
     return parser
 
 
-def get_main_parser():
+def get_main_parser(only: Optional[str] = None):
     """The main parser for Jina
 
+    :param only: the name of a sub-command; if given, only this sub-command parser is built. Unknown names build all
     :return: the parser
     """
     from .base import set_base_parser
@@ -178,108 +180,106 @@ def get_main_parser():
         required=True,
     )
 
-    set_hello_parser(
-        sp.add_parser(
+    sub_parsers = [
+        (
             'hello',
-            help='👋 Hello Jina!',
-            description='Start hello world demos.',
-            formatter_class=_chf,
-        )
-    )
-
-    set_pea_parser(
-        sp.add_parser(
+            set_hello_parser,
+            dict(help='👋 Hello Jina!', description='Start hello world demos.'),
+        ),
+        (
             'executor',
-            help='Start an Executor',
-            description='Start an Executor. Executor is how Jina processes Document.',
-            formatter_class=_chf,
-        )
-    )
-
-    set_flow_parser(
-        sp.add_parser(
+            set_pea_parser,
+            dict(
+                help='Start an Executor',
+                description='Start an Executor. Executor is how Jina processes Document.',
+            ),
+        ),
+        (
             'flow',
-            description='Start a Flow. Flow is how Jina streamlines and distributes Executors.',
-            help='Start a Flow',
-            formatter_class=_chf,
-        )
-    )
-
-    set_ping_parser(
-        sp.add_parser(
+            set_flow_parser,
+            dict(
+                description='Start a Flow. Flow is how Jina streamlines and distributes Executors.',
+                help='Start a Flow',
+            ),
+        ),
+        (
             'ping',
-            help='Ping an Executor',
-            description='Ping a Pod and check its network connectivity.',
-            formatter_class=_chf,
-        )
-    )
-
-    set_gateway_parser(
-        sp.add_parser(
+            set_ping_parser,
+            dict(
+                help='Ping an Executor',
+                description='Ping a Pod and check its network connectivity.',
+            ),
+        ),
+        (
             'gateway',
-            description='Start a Gateway that receives client Requests via gRPC/REST interface',
-            **(dict(help='Start a Gateway')) if _SHOW_ALL_ARGS else {},
-            formatter_class=_chf,
-        )
-    )
-
-    set_hub_parser(
-        sp.add_parser(
+            set_gateway_parser,
+            dict(
+                description='Start a Gateway that receives client Requests via gRPC/REST interface',
+                **(dict(help='Start a Gateway')) if _SHOW_ALL_ARGS else {},
+            ),
+        ),
+        (
             'hub',
-            help='Push/pull an Executor to/from Jina Hub',
-            description='Push/Pull an Executor to/from Jina Hub',
-            formatter_class=_chf,
-        )
-    )
-
-    set_help_parser(
-        sp.add_parser(
+            set_hub_parser,
+            dict(
+                help='Push/pull an Executor to/from Jina Hub',
+                description='Push/Pull an Executor to/from Jina Hub',
+            ),
+        ),
+        (
             'help',
-            help='Show help text of a CLI argument',
-            description='Show help text of a CLI argument',
-            formatter_class=_chf,
-        )
-    )
-    # Below are low-level / internal / experimental CLIs, hidden from users by default
-
-    set_pea_parser(
-        sp.add_parser(
+            set_help_parser,
+            dict(
+                help='Show help text of a CLI argument',
+                description='Show help text of a CLI argument',
+            ),
+        ),
+        # Below are low-level / internal / experimental CLIs, hidden from users by default
+        (
             'pea',
-            description='Start a Pea. '
-            'You should rarely use this directly unless you '
-            'are doing low-level orchestration',
-            formatter_class=_chf,
-            **(dict(help='Start a Pea')) if _SHOW_ALL_ARGS else {},
-        )
-    )
-
-    set_pod_parser(
-        sp.add_parser(
+            set_pea_parser,
+            dict(
+                description='Start a Pea. '
+                'You should rarely use this directly unless you '
+                'are doing low-level orchestration',
+                **(dict(help='Start a Pea')) if _SHOW_ALL_ARGS else {},
+            ),
+        ),
+        (
             'pod',
-            description='Start a Pod. '
-            'You should rarely use this directly unless you '
-            'are doing low-level orchestration',
-            formatter_class=_chf,
-            **(dict(help='Start a Pod')) if _SHOW_ALL_ARGS else {},
-        )
-    )
-
-    set_client_cli_parser(
-        sp.add_parser(
+            set_pod_parser,
+            dict(
+                description='Start a Pod. '
+                'You should rarely use this directly unless you '
+                'are doing low-level orchestration',
+                **(dict(help='Start a Pod')) if _SHOW_ALL_ARGS else {},
+            ),
+        ),
+        (
             'client',
-            description='Start a Python client that connects to a remote Jina gateway',
-            formatter_class=_chf,
-            **(dict(help='Start a Client')) if _SHOW_ALL_ARGS else {},
-        )
-    )
-
-    set_export_api_parser(
-        sp.add_parser(
+            set_client_cli_parser,
+            dict(
+                description='Start a Python client that connects to a remote Jina gateway',
+                **(dict(help='Start a Client')) if _SHOW_ALL_ARGS else {},
+            ),
+        ),
+        (
             'export-api',
-            description='Export Jina API to JSON/YAML file for 3rd party applications',
-            formatter_class=_chf,
-            **(dict(help='Export Jina API to file')) if _SHOW_ALL_ARGS else {},
-        )
-    )
+            set_export_api_parser,
+            dict(
+                description='Export Jina API to JSON/YAML file for 3rd party applications',
+                **(dict(help='Export Jina API to file')) if _SHOW_ALL_ARGS else {},
+            ),
+        ),
+    ]
+
+    # building every sub-command parser is the dominant cost of the CLI startup
+    sub_parsers = [s for s in sub_parsers if s[0] == only] or sub_parsers
+
+    for name, set_parser, kwargs in sub_parsers:
+        sub_parser = sp.add_parser(name, formatter_class=_chf, **kwargs)
+        set_parser(sub_parser)
+        # the name of the handler in `cli.api`, resolved here once instead of on every dispatch
+        sub_parser.set_defaults(_api_func_name=name.replace('-', '_'))
 
     return parser
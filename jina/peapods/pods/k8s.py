@@ -1,8 +1,25 @@
+import asyncio
 import copy
+import json
+import logging
+import math
 import os
 import time
 from argparse import Namespace
-from typing import Optional, Dict, Union, Set, List, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import (
+    Callable,
+    Optional,
+    Dict,
+    Union,
+    Set,
+    List,
+    Iterable,
+    Iterator,
+    FrozenSet,
+    TYPE_CHECKING,
+)
 
 import jina
 from .k8slib import kubernetes_deployment, kubernetes_client
@@ -10,6 +27,36 @@ from ..pods import BasePod
 from ... import __default_executor__
 from ...logging.logger import JinaLogger
 from ...excepts import RuntimeFailToStart
+from ...helper import get_or_reuse_loop
+
+if TYPE_CHECKING:
+    from kubernetes.client import V1Deployment
+
+
+@lru_cache()
+def _get_base_executor_version_cached(jina_version: str) -> str:
+    """Get the tag of the Jina image to run the Executors with, fetched once per process.
+
+    :param jina_version: the version of Jina
+    :return: `jina_version` if it is published on Docker Hub, otherwise `master`
+    """
+    import requests
+
+    url = 'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags'
+    resp = requests.get(url, timeout=5)
+    resp.raise_for_status()
+    name_set = {tag['name'] for tag in resp.json()}
+    if jina_version in name_set:
+        return jina_version
+    else:
+        return 'master'
+
+
+class _PrefixedLogger(logging.LoggerAdapter):
+    """Prefix the messages of the `k8slib` helpers with the operation they are part of."""
+
+    def process(self, msg, kwargs):
+        return f'{self.extra["prefix"]} {msg}', kwargs
 
 
 class K8sPod(BasePod):
@@ -38,12 +85,34 @@ class K8sPod(BasePod):
             self.deployment_args = deployment_args
             self.k8s_namespace = self.common_args.k8s_namespace
             self.num_replicas = getattr(self.deployment_args, 'replicas', 1)
+            self._clients = None
+            # read once per deployment, not at import time: the k8s tests set it in a fixture
+            self._use_test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
+            self._jina_logger = None
+
+        @property
+        def _logger(self) -> JinaLogger:
+            # built on first use, a deployment that is never started needs no logger
+            if self._jina_logger is None:
+                self._jina_logger = JinaLogger(f'k8s_{self.name}')
+            return self._jina_logger
+
+        def _close_logger(self):
+            if self._jina_logger is not None:
+                self._jina_logger.close()
+                self._jina_logger = None
+
+        @property
+        def _k8s_clients(self) -> 'kubernetes_client.K8sClients':
+            # built on first use, creating `K8sClients` loads the cluster configuration
+            if self._clients is None:
+                self._clients = kubernetes_client.K8sClients()
+            return self._clients
 
         def _deploy_gateway(self):
-            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
             image_name = (
                 'jinaai/jina:test-pip'
-                if test_pip
+                if self._use_test_pip
                 else f'jinaai/jina:{self.version}-py38-standard'
             )
             kubernetes_deployment.deploy_service(
@@ -54,7 +123,7 @@ class K8sPod(BasePod):
                 container_args=f'["gateway", '
                 f'"--grpc-data-requests", '
                 f'{kubernetes_deployment.get_cli_params(self.common_args, ("pod_role",))}]',
-                logger=JinaLogger(f'deploy_{self.name}'),
+                logger=_PrefixedLogger(self._logger.logger, {'prefix': '[deploy]'}),
                 replicas=1,
                 pull_policy='IfNotPresent',
                 port_expose=self.common_args.port_expose,
@@ -79,10 +148,9 @@ class K8sPod(BasePod):
         def _get_image_name(self):
             image_name = kubernetes_deployment.get_image_name(self.deployment_args.uses)
             if image_name == __default_executor__:
-                test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
                 image_name = (
                     'jinaai/jina:test-pip'
-                    if test_pip
+                    if self._use_test_pip
                     else f'jinaai/jina:{self.version}-py38-perf'
                 )
 
@@ -100,7 +168,7 @@ class K8sPod(BasePod):
             )
             uses_with_string = f'"--uses-with", "{uses_with}", ' if uses_with else ''
             uses = self.deployment_args.uses
-            if self.deployment_args.uses != __default_executor__:
+            if uses != __default_executor__:
                 uses = 'config.yml'
             return self._construct_runtime_container_args(
                 self.deployment_args, uses, uses_metas, uses_with_string
@@ -117,7 +185,7 @@ class K8sPod(BasePod):
                 image_name=image_name,
                 container_cmd='["jina"]',
                 container_args=container_args,
-                logger=JinaLogger(f'deploy_{self.name}'),
+                logger=_PrefixedLogger(self._logger.logger, {'prefix': '[deploy]'}),
                 replicas=self.num_replicas,
                 pull_policy='IfNotPresent',
                 init_container=init_container_args,
@@ -138,7 +206,7 @@ class K8sPod(BasePod):
                 image_name=image_name,
                 container_cmd='["jina"]',
                 container_args=container_args,
-                logger=JinaLogger(f'restart_{self.name}'),
+                logger=_PrefixedLogger(self._logger.logger, {'prefix': '[restart]'}),
                 replicas=self.num_replicas,
                 pull_policy='IfNotPresent',
                 custom_resource_dir=getattr(
@@ -155,163 +223,177 @@ class K8sPod(BasePod):
 
             from kubernetes import client
 
-            with JinaLogger(f'waiting_for_{self.name}') as logger:
-                logger.debug(
-                    f'🏝️\n\t\tWaiting for "{self.name}" to be ready, with {self.num_replicas} replicas'
-                )
-                timeout_ns = 1000000000 * _timeout if _timeout else None
-                now = time.time_ns()
-                exception_to_raise = None
-                while timeout_ns is None or time.time_ns() - now < timeout_ns:
-                    try:
-                        api_response = self._read_namespaced_deployment()
-                        assert api_response.status.replicas == self.num_replicas
-                        if (
-                            api_response.status.ready_replicas is not None
-                            and api_response.status.ready_replicas == self.num_replicas
-                        ):
-                            logger.success(f' {self.name} has all its replicas ready!!')
-                            return
-                        else:
-                            ready_replicas = api_response.status.ready_replicas or 0
-                            logger.debug(
-                                f'\nNumber of ready replicas {ready_replicas}, waiting for {self.num_replicas - ready_replicas} replicas to be available'
-                            )
-                            time.sleep(1.0)
-                    except client.ApiException as ex:
-                        exception_to_raise = ex
-                        break
+            logger = self._logger
+            logger.debug(
+                f'[wait] 🏝️\n\t\tWaiting for "{self.name}" to be ready, with {self.num_replicas} replicas'
+            )
+            exception_to_raise = None
+            try:
+                for api_response in self._stream_namespaced_deployment(_timeout):
+                    if (
+                        api_response.status.ready_replicas is not None
+                        and api_response.status.ready_replicas == self.num_replicas
+                    ):
+                        logger.success(
+                            f'[wait] {self.name} has all its replicas ready!!'
+                        )
+                        return
+                    elif logger.debug_enabled:
+                        ready_replicas = api_response.status.ready_replicas or 0
+                        logger.debug(
+                            f'[wait]\nNumber of ready replicas {ready_replicas}, waiting for {self.num_replicas - ready_replicas} replicas to be available'
+                        )
+            except client.ApiException as ex:
+                exception_to_raise = ex
             fail_msg = f' Deployment {self.name} did not start with a timeout of {self.common_args.timeout_ready}'
             if exception_to_raise:
                 fail_msg += f': {repr(exception_to_raise)}'
             raise RuntimeFailToStart(fail_msg)
 
-        async def wait_restart_success(self, previous_uids: Iterable[str] = None):
+        @staticmethod
+        async def _next_deployment(
+            deployments: Iterator, executor: ThreadPoolExecutor
+        ) -> Optional['V1Deployment']:
+            # the k8s client is blocking, read the deployment from a thread, not the loop
+            return await get_or_reuse_loop().run_in_executor(
+                executor, next, deployments, None
+            )
+
+        async def _await_restart(
+            self,
+            previous_uids: FrozenSet[str],
+            timeout: Optional[float],
+            logger,
+            executor: ThreadPoolExecutor,
+        ) -> bool:
+            loop = get_or_reuse_loop()
+            deployments = self._stream_namespaced_deployment(timeout)
+            updated = False
+            while not updated:
+                api_response = await self._next_deployment(deployments, executor)
+                if api_response is None:
+                    return False
+                if logger.debug_enabled:
+                    logger.debug(
+                        f'[wait]\n\t\t Updated Replicas: {api_response.status.updated_replicas}.'
+                        f' Replicas: {api_response.status.replicas}.'
+                        f' Expected Replicas {self.num_replicas}'
+                    )
+                updated_replicas = api_response.status.updated_replicas or 0
+                alive_replicas = api_response.status.replicas or 0
+                updated = (
+                    updated_replicas == self.num_replicas
+                    and alive_replicas == self.num_replicas
+                )
+                if not logger.debug_enabled:
+                    continue
+                if updated_replicas < self.num_replicas:
+                    logger.debug(
+                        f'[wait]\nNumber of updated replicas {updated_replicas}, waiting for {self.num_replicas - updated_replicas} replicas to be updated'
+                    )
+                elif not updated:
+                    logger.debug(
+                        f'[wait]\nNumber of alive replicas {alive_replicas}, waiting for {alive_replicas - self.num_replicas} old replicas to be terminated'
+                    )
+
+            # old Pods still terminating do not change the deployment anymore, poll for them to be gone
+            deployments.close()
+            while await loop.run_in_executor(
+                executor, self._has_pod_with_uid, previous_uids
+            ):
+                logger.debug(f'[wait]\nWaiting for old replicas to be terminated')
+                await asyncio.sleep(1.0)
+            return True
+
+        async def _wait_within_timeout(self, await_fn: Callable, verb: str):
+            """Run one of the `_await_*` coroutines, bounded by `timeout_ready`
+
+            :param await_fn: returns the coroutine, given the timeout, logger and executor
+            :param verb: what is being waited for, used in the failure message
+            """
             _timeout = self.common_args.timeout_ready
             if _timeout <= 0:
                 _timeout = None
             else:
                 _timeout /= 1e3
 
-            if previous_uids is None:
-                previous_uids = []
-
             from kubernetes import client
-            import asyncio
-
-            k8s_client = kubernetes_client.K8sClients().apps_v1
 
-            with JinaLogger(f'waiting_restart_for_{self.name}') as logger:
-                logger.info(
-                    f'🏝️\n\t\tWaiting for "{self.name}" to be restarted, with {self.num_replicas} replicas'
-                )
-                timeout_ns = 1000000000 * _timeout if _timeout else None
-                now = time.time_ns()
-                exception_to_raise = None
-                while timeout_ns is None or time.time_ns() - now < timeout_ns:
-                    try:
-                        api_response = k8s_client.read_namespaced_deployment(
-                            name=self.dns_name, namespace=self.k8s_namespace
-                        )
-                        logger.debug(
-                            f'\n\t\t Updated Replicas: {api_response.status.updated_replicas}.'
-                            f' Replicas: {api_response.status.replicas}.'
-                            f' Expected Replicas {self.num_replicas}'
-                        )
-
-                        has_pod_with_uid = self._has_pod_with_uid(previous_uids)
-                        if (
-                            api_response.status.updated_replicas is not None
-                            and api_response.status.updated_replicas
-                            == self.num_replicas
-                            and api_response.status.replicas == self.num_replicas
-                            and not has_pod_with_uid
-                        ):
-                            logger.success(
-                                f' {self.name} has all its replicas updated!!'
-                            )
-                            return
-                        else:
-                            updated_replicas = api_response.status.updated_replicas or 0
-                            alive_replicas = api_response.status.replicas or 0
-                            if updated_replicas < self.num_replicas:
-                                logger.debug(
-                                    f'\nNumber of updated replicas {updated_replicas}, waiting for {self.num_replicas - updated_replicas} replicas to be updated'
-                                )
-                            elif has_pod_with_uid:
-                                logger.debug(
-                                    f'\nWaiting for old replicas to be terminated'
-                                )
-                            else:
-                                logger.debug(
-                                    f'\nNumber of alive replicas {alive_replicas}, waiting for {alive_replicas - self.num_replicas} old replicas to be terminated'
-                                )
-
-                            await asyncio.sleep(1.0)
-                    except client.ApiException as ex:
-                        exception_to_raise = ex
-                        break
-            fail_msg = f' Deployment {self.name} did not restart with a timeout of {self.common_args.timeout_ready}'
+            logger = self._logger
+            exception_to_raise = None
+            # a thread of its own: the waiters of all shards run at once and would
+            # otherwise queue up on the default executor of the loop
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                if await asyncio.wait_for(
+                    await_fn(_timeout, logger, executor), timeout=_timeout
+                ):
+                    logger.success(f'[wait] {self.name} has all its replicas updated!!')
+                    return
+            except asyncio.TimeoutError:
+                pass
+            except client.ApiException as ex:
+                exception_to_raise = ex
+            finally:
+                # the thread may still wait on the watch after a timeout
+                executor.shutdown(wait=False)
+            fail_msg = f' Deployment {self.name} did not {verb} with a timeout of {self.common_args.timeout_ready}'
             if exception_to_raise:
                 fail_msg += f': {repr(exception_to_raise)}'
             raise RuntimeFailToStart(fail_msg)
 
-        async def wait_scale_success(self, replicas: int):
-            scale_to = replicas
-            _timeout = self.common_args.timeout_ready
-            if _timeout <= 0:
-                _timeout = None
-            else:
-                _timeout /= 1e3
+        async def wait_restart_success(self, previous_uids: Iterable[str] = None):
+            # checked against the current Pods on every poll, hash them once
+            previous_uids = frozenset(previous_uids or ())
 
-            import asyncio
-            from kubernetes import client
+            self._logger.info(
+                f'[wait] 🏝️\n\t\tWaiting for "{self.name}" to be restarted, with {self.num_replicas} replicas'
+            )
+            await self._wait_within_timeout(
+                partial(self._await_restart, previous_uids), 'restart'
+            )
 
-            with JinaLogger(f'waiting_scale_for_{self.name}') as logger:
-                logger.info(
-                    f'🏝️\n\t\tWaiting for "{self.name}" to be scaled, with {self.num_replicas} replicas,'
-                    f'scale to {scale_to}.'
-                )
-                timeout_ns = 1000000000 * _timeout if _timeout else None
-                now = time.time_ns()
-                exception_to_raise = None
-                while timeout_ns is None or time.time_ns() - now < timeout_ns:
-                    try:
-                        api_response = kubernetes_client.K8sClients().apps_v1.read_namespaced_deployment(
-                            name=self.dns_name, namespace=self.k8s_namespace
+        async def _await_scale(
+            self,
+            scale_to: int,
+            timeout: Optional[float],
+            logger,
+            executor: ThreadPoolExecutor,
+        ) -> bool:
+            deployments = self._stream_namespaced_deployment(timeout)
+            while True:
+                api_response = await self._next_deployment(deployments, executor)
+                if api_response is None:
+                    return False
+                if logger.debug_enabled:
+                    logger.debug(
+                        f'[wait]\n\t\t Scaled replicas: {api_response.status.ready_replicas}.'
+                        f' Replicas: {api_response.status.replicas}.'
+                        f' Expected Replicas {scale_to}'
+                    )
+                if (
+                    api_response.status.ready_replicas is not None
+                    and api_response.status.ready_replicas == scale_to
+                ):
+                    return True
+                elif logger.debug_enabled:
+                    scaled_replicas = api_response.status.ready_replicas or 0
+                    if scaled_replicas < scale_to:
+                        logger.debug(
+                            f'[wait]\nNumber of replicas {scaled_replicas}, waiting for {scale_to - scaled_replicas} replicas to be scaled up.'
                         )
+                    else:
                         logger.debug(
-                            f'\n\t\t Scaled replicas: {api_response.status.ready_replicas}.'
-                            f' Replicas: {api_response.status.replicas}.'
-                            f' Expected Replicas {scale_to}'
+                            f'[wait]\nNumber of replicas {scaled_replicas}, waiting for {scaled_replicas - scale_to} replicas to be scaled down.'
                         )
-                        if (
-                            api_response.status.ready_replicas is not None
-                            and api_response.status.ready_replicas == scale_to
-                        ):
-                            logger.success(
-                                f' {self.name} has all its replicas updated!!'
-                            )
-                            return
-                        else:
-                            scaled_replicas = api_response.status.ready_replicas or 0
-                            if scaled_replicas < scale_to:
-                                logger.debug(
-                                    f'\nNumber of replicas {scaled_replicas}, waiting for {scale_to - scaled_replicas} replicas to be scaled up.'
-                                )
-                            else:
-                                logger.debug(
-                                    f'\nNumber of replicas {scaled_replicas}, waiting for {scaled_replicas - scale_to} replicas to be scaled down.'
-                                )
-
-                            await asyncio.sleep(1.0)
-                    except client.ApiException as ex:
-                        exception_to_raise = ex
-                        break
-            fail_msg = f' Deployment {self.name} did not restart with a timeout of {self.common_args.timeout_ready}'
-            if exception_to_raise:
-                fail_msg += f': {repr(exception_to_raise)}'
-            raise RuntimeFailToStart(fail_msg)
+
+        async def wait_scale_success(self, replicas: int):
+            scale_to = replicas
+            self._logger.info(
+                f'[wait] 🏝️\n\t\tWaiting for "{self.name}" to be scaled, with {self.num_replicas} replicas,'
+                f'scale to {scale_to}.'
+            )
+            await self._wait_within_timeout(partial(self._await_scale, scale_to), 'scale')
 
         def rolling_update(
             self, dump_path: Optional[str] = None, *, uses_with: Optional[Dict] = None
@@ -337,47 +419,84 @@ class K8sPod(BasePod):
             self._patch_namespaced_deployment_scale(replicas)
 
         def start(self):
-            with JinaLogger(f'start_{self.name}') as logger:
-                logger.debug(f'\t\tDeploying "{self.name}"')
-                if self.name == 'gateway':
-                    self._deploy_gateway()
-                else:
-                    self._deploy_runtime()
-                if not self.common_args.noblock_on_start:
-                    self.wait_start_success()
+            self._logger.debug(f'[start]\t\tDeploying "{self.name}"')
+            if self.name == 'gateway':
+                self._deploy_gateway()
+            else:
+                self._deploy_runtime()
+            if not self.common_args.noblock_on_start:
+                self.wait_start_success()
             return self
 
         def close(self):
             from kubernetes import client
 
-            with JinaLogger(f'close_{self.name}') as logger:
-                try:
-                    resp = self._delete_namespaced_deployment()
-                    if resp.status == 'Success':
-                        logger.success(
-                            f' Successful deletion of deployment {self.name}'
-                        )
-                    else:
-                        logger.error(
-                            f' Deletion of deployment {self.name} unsuccessful with status {resp.status}'
-                        )
-                except client.ApiException as exc:
+            logger = self._logger
+            try:
+                resp = self._delete_namespaced_deployment()
+                if resp.status == 'Success':
+                    logger.success(
+                        f'[close] Successful deletion of deployment {self.name}'
+                    )
+                else:
                     logger.error(
-                        f' Error deleting deployment {self.name}: {exc.reason} '
+                        f'[close] Deletion of deployment {self.name} unsuccessful with status {resp.status}'
                     )
+            except client.ApiException as exc:
+                logger.error(
+                    f'[close] Error deleting deployment {self.name}: {exc.reason} '
+                )
+            finally:
+                self._close_logger()
 
         def _delete_namespaced_deployment(self):
-            return kubernetes_client.K8sClients().apps_v1.delete_namespaced_deployment(
+            return self._k8s_clients.apps_v1.delete_namespaced_deployment(
                 name=self.dns_name, namespace=self.k8s_namespace
             )
 
         def _read_namespaced_deployment(self):
-            return kubernetes_client.K8sClients().apps_v1.read_namespaced_deployment(
+            return self._k8s_clients.apps_v1.read_namespaced_deployment(
                 name=self.dns_name, namespace=self.k8s_namespace
             )
 
+        def _watch_namespaced_deployment(self, **kwargs):
+            from kubernetes import watch
+
+            return watch.Watch().stream(
+                self._k8s_clients.apps_v1.list_namespaced_deployment,
+                namespace=self.k8s_namespace,
+                field_selector=f'metadata.name={self.dns_name}',
+                **kwargs,
+            )
+
+        def _stream_namespaced_deployment(self, timeout: Optional[float] = None):
+            """Stream the deployment as it is now, and then again on every change the API server notifies
+
+            :param timeout: seconds after which the stream ends, or None to never end it
+            :yield: the deployment
+            """
+            yield self._read_namespaced_deployment()
+            if timeout is None:
+                # without `timeout_seconds` the watch reconnects by itself when the server closes it
+                for event in self._watch_namespaced_deployment():
+                    yield event['object']
+            else:
+                deadline = time.time() + timeout
+                while True:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    # a new watch always starts with the current state of the deployment,
+                    # `timeout_seconds=0` would mean no timeout to the API server
+                    for event in self._watch_namespaced_deployment(
+                        timeout_seconds=max(1, math.ceil(remaining))
+                    ):
+                        yield event['object']
+                    # the watch ended before the deadline, do not reopen it in a tight loop
+                    time.sleep(min(1.0, max(0.0, deadline - time.time())))
+
         def _patch_namespaced_deployment_scale(self, replicas: int):
-            kubernetes_client.K8sClients().apps_v1.patch_namespaced_deployment_scale(
+            self._k8s_clients.apps_v1.patch_namespaced_deployment_scale(
                 self.dns_name,
                 namespace=self.k8s_namespace,
                 body={'spec': {'replicas': replicas}},
@@ -388,21 +507,24 @@ class K8sPod(BasePod):
 
             :return: list of uids as strings for all pods in the deployment
             """
-            pods = kubernetes_client.K8sClients().core_v1.list_namespaced_pod(
-                namespace=self.k8s_namespace, label_selector=f'app={self.dns_name}'
+            # only the UIDs are needed, skip deserializing the full `V1Pod` models
+            response = self._k8s_clients.core_v1.list_namespaced_pod(
+                namespace=self.k8s_namespace,
+                label_selector=f'app={self.dns_name}',
+                _preload_content=False,
             )
 
-            return [item.metadata.uid for item in pods.items]
+            pods = json.loads(response.data)['items']
+
+            return [item['metadata']['uid'] for item in pods]
 
-        def _has_pod_with_uid(self, uids: Iterable[str]) -> bool:
+        def _has_pod_with_uid(self, uids: FrozenSet[str]) -> bool:
             """Check if this deployment has any Pod with a UID contained in uids
 
-            :param uids: list of UIDs to check
+            :param uids: set of UIDs to check
             :return: True if any Pod has a UID in uids
             """
-            current_pods_uids = self.get_pod_uids()
-
-            return any(uid in current_pods_uids for uid in uids)
+            return not uids.isdisjoint(self.get_pod_uids())
 
         def __enter__(self):
             return self.start()
@@ -507,7 +629,8 @@ class K8sPod(BasePod):
             )
 
         for i in range(shards):
-            cargs = copy.deepcopy(args)
+            # shards only differ in top-level attributes, nested values (e.g. `uses_with`) are shared
+            cargs = copy.copy(args)
             cargs.shard_id = i
             parsed_args['deployments'].append(cargs)
         return parsed_args
@@ -542,8 +665,12 @@ class K8sPod(BasePod):
             old_uids[deployment.dns_name] = deployment.get_pod_uids()
             deployment.rolling_update(dump_path=dump_path, uses_with=uses_with)
 
-        for deployment in self.k8s_deployments:
-            await deployment.wait_restart_success(old_uids[deployment.dns_name])
+        await asyncio.gather(
+            *(
+                deployment.wait_restart_success(old_uids[deployment.dns_name])
+                for deployment in self.k8s_deployments
+            )
+        )
 
     async def scale(self, replicas: int):
         """
@@ -553,8 +680,13 @@ class K8sPod(BasePod):
         """
         for deployment in self.k8s_deployments:
             deployment.scale(replicas=replicas)
+        await asyncio.gather(
+            *(
+                deployment.wait_scale_success(replicas=replicas)
+                for deployment in self.k8s_deployments
+            )
+        )
         for deployment in self.k8s_deployments:
-            await deployment.wait_scale_success(replicas=replicas)
             deployment.num_replicas = replicas
 
     def start(self) -> 'K8sPod':
@@ -566,8 +698,28 @@ class K8sPod(BasePod):
             logger.debug(f'🏝️\tCreate deployments for "{self.name}"')
             if self.k8s_head_deployment is not None:
                 self.enter_context(self.k8s_head_deployment)
-            for k8s_deployment in self.k8s_deployments:
-                self.enter_context(k8s_deployment)
+            # the shards do not depend on each other, talk to the K8s API for all of them at once
+            with ThreadPoolExecutor(
+                max_workers=min(len(self.k8s_deployments), 8)
+            ) as executor:
+                futures = [executor.submit(d.start) for d in self.k8s_deployments]
+            start_exception = None
+            for k8s_deployment, future in zip(self.k8s_deployments, futures):
+                exc = future.exception()
+                if exc is None:
+                    # same as `enter_context`, only the started deployments are closed on exit
+                    self.push(k8s_deployment)
+                else:
+                    # not closed on exit, the deployment is not registered
+                    k8s_deployment._close_logger()
+                    if start_exception is None:
+                        start_exception = exc
+                    else:
+                        logger.error(
+                            f'Deployment {k8s_deployment.name} failed to start: {exc!r}'
+                        )
+            if start_exception is not None:
+                raise start_exception
             if self.k8s_tail_deployment is not None:
                 self.enter_context(self.k8s_tail_deployment)
         return self
@@ -664,12 +816,10 @@ class K8sPod(BasePod):
     def _get_base_executor_version(self):
         import requests
 
-        url = 'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags'
-        tags = requests.get(url).json()
-        name_set = {tag['name'] for tag in tags}
-        if jina.__version__ in name_set:
-            return jina.__version__
-        else:
+        try:
+            return _get_base_executor_version_cached(jina.__version__)
+        except (requests.RequestException, ValueError, TypeError, KeyError):
+            # Docker Hub is unreachable or sent garbage, failures are not cached so the next Pod retries
             return 'master'
 
     @property
@@ -691,17 +841,21 @@ class K8sPod(BasePod):
                     f'{args.name}/shard-{i}'
                     for i, args in enumerate(self.deployment_args['deployments'])
                 ]
+                # one fragment per shard, joined with the same separator `Flow` uses for the whole graph
                 for shard_name in shard_names:
-                    shard_mermaid_graph = [
-                        f'subgraph {shard_name}\n',
-                        f'direction TB;\n',
-                    ]
-                    for replica_id in range(num_replicas):
-                        shard_mermaid_graph.append(
-                            f'{shard_name}/replica-{replica_id}[{uses}]\n'
+                    mermaid_graph.append(
+                        '\n'.join(
+                            [
+                                f'subgraph {shard_name}\n',
+                                f'direction TB;\n',
+                                *(
+                                    f'{shard_name}/replica-{replica_id}[{uses}]\n'
+                                    for replica_id in range(num_replicas)
+                                ),
+                                f'end\n',
+                            ]
                         )
-                    shard_mermaid_graph.append(f'end\n')
-                    mermaid_graph.extend(shard_mermaid_graph)
+                    )
                 head_name = f'{self.name}/head'
                 tail_name = f'{self.name}/tail'
                 head_to_show = self.args.uses_before
@@ -722,8 +876,12 @@ class K8sPod(BasePod):
                             f'{shard_name}[{uses}] --> {tail_name}[{tail_to_show}]:::HEADTAIL;'
                         )
             else:
-                for replica_id in range(num_replicas):
-                    mermaid_graph.append(f'{self.name}/replica-{replica_id}[{uses}];')
+                mermaid_graph.append(
+                    '\n'.join(
+                        f'{self.name}/replica-{replica_id}[{uses}];'
+                        for replica_id in range(num_replicas)
+                    )
+                )
 
             mermaid_graph.append(f'end;')
         return mermaid_graph
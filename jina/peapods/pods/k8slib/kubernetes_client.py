@@ -1,3 +1,10 @@
+import threading
+
+# loading the config replaces the process-wide default `Configuration` and may write refreshed
+# credentials back to the kube config file, the shards of a `K8sPod` are deployed from threads
+_config_lock = threading.Lock()
+
+
 class K8sClients:
     """
     The Kubernetes api is wrapped into a class to have a lazy reading of the cluster configuration.
@@ -7,15 +14,16 @@ class K8sClients:
     def __init__(self):
         import kubernetes
 
-        try:
-            # try loading kube config from disk first
-            kubernetes.config.load_kube_config()
-        except kubernetes.config.config_exception.ConfigException:
-            # if the config could not be read from disk, try loading in cluster config
-            # this works if we are running inside k8s
-            kubernetes.config.load_incluster_config()
+        with _config_lock:
+            try:
+                # try loading kube config from disk first
+                kubernetes.config.load_kube_config()
+            except kubernetes.config.config_exception.ConfigException:
+                # if the config could not be read from disk, try loading in cluster config
+                # this works if we are running inside k8s
+                kubernetes.config.load_incluster_config()
 
-        self._k8s_client = kubernetes.client.ApiClient()
+            self._k8s_client = kubernetes.client.ApiClient()
         self._core_v1 = None
         self._apps_v1 = None
         self._beta = None
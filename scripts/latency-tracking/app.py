@@ -10,7 +10,7 @@ from typing import Dict
 # this line is needed here for measuring import time accurately for 1M imports
 import_time = timeit.timeit(stmt='import jina', number=1000000)
 
-from jina import Document, Flow, __version__
+from jina import Document, Flow, __version__, __resources_path__
 from jina.helloworld.fashion.helper import (
     download_data,
     index_generator,
@@ -20,7 +20,6 @@ from jina.logging.logger import JinaLogger
 from jina.parsers.helloworld import set_hw_parser
 from jina.types.arrays.memmap import DocumentArrayMemmap
 from packaging import version
-from pkg_resources import resource_filename
 
 try:
     from jina.helloworld.fashion.executors import MyEncoder, MyIndexer
@@ -252,13 +251,11 @@ def cleanup() -> None:
 
 
 def main() -> None:
-    os.environ['PATH'] += os.pathsep + resource_filename('jina', 'resources')
-    os.environ['PATH'] += (
-        os.pathsep + resource_filename('jina', 'resources') + '/fashion/'
-    )
+    os.environ['PATH'] += os.pathsep + __resources_path__
+    os.environ['PATH'] += os.pathsep + __resources_path__ + '/fashion/'
 
     for k, v in {
-        'RESOURCE_DIR': resource_filename('jina', 'resources'),
+        'RESOURCE_DIR': __resources_path__,
         'SHARDS': 4,
         'PARALLEL': 4,
         'REPLICAS': 4,
@@ -2,12 +2,13 @@ from typing import Union, Dict, Tuple, List, Optional, Set
 from unittest.mock import Mock
 
 import pytest
+import requests
 from kubernetes import client
 
 import jina
 from jina.helper import Namespace
 from jina.parsers import set_pod_parser, set_gateway_parser
-from jina.peapods.pods.k8s import K8sPod
+from jina.peapods.pods.k8s import K8sPod, _get_base_executor_version_cached
 from jina.peapods.pods.k8slib import kubernetes_deployment, kubernetes_client
 from jina.peapods.pods.k8slib.kubernetes_deployment import dictionary_to_cli_param
 
@@ -39,6 +40,7 @@ def test_version(is_master, requests_mock):
         'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags',
         text='[{"name": "v1"}, {"name": "' + version + '"}]',
     )
+    _get_base_executor_version_cached.cache_clear()
     pod = K8sPod(args)
     if is_master:
         assert pod.version == 'master'
@@ -46,6 +48,38 @@ def test_version(is_master, requests_mock):
         assert pod.version == jina.__version__
 
 
+def test_version_fetched_once(requests_mock):
+    args = set_pod_parser().parse_args(['--name', 'test-pod'])
+    _get_base_executor_version_cached.cache_clear()
+    requests_mock.get(
+        'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags',
+        text='[{"name": "' + jina.__version__ + '"}]',
+    )
+    K8sPod(args)
+    K8sPod(args)
+    assert requests_mock.call_count == 1
+
+
+@pytest.mark.parametrize(
+    'response',
+    [
+        {'status_code': 429, 'json': {'message': 'Too Many Requests'}},
+        {'json': {'message': 'not a list of tags'}},
+        {'exc': requests.exceptions.ConnectionError},
+    ],
+)
+def test_version_registry_failure(response, requests_mock):
+    args = set_pod_parser().parse_args(['--name', 'test-pod'])
+    _get_base_executor_version_cached.cache_clear()
+    requests_mock.get(
+        'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags', **response
+    )
+    assert K8sPod(args).version == 'master'
+    # failures are not cached, the next Pod asks again
+    K8sPod(args)
+    assert requests_mock.call_count == 2
+
+
 def test_dictionary_to_cli_param():
     assert (
         dictionary_to_cli_param({'k1': 'v1', 'k2': {'k3': 'v3'}})
@@ -285,16 +319,42 @@ def test_start_deploys_runtime_with_shards(shards: int):
     head_call_args = deploy_mock.call_args_list[0][0]
     assert head_call_args[0] == pod.name + '-head'
 
+    # the shards are deployed concurrently, in no particular order
     executor_call_args_list = [
         deploy_mock.call_args_list[i][0] for i in range(1, shards + 1)
     ]
-    for i, call_args in enumerate(executor_call_args_list):
-        assert call_args[0] == pod.name + f'-{i}'
+    assert sorted(call_args[0] for call_args in executor_call_args_list) == sorted(
+        pod.name + f'-{i}' for i in range(shards)
+    )
 
     tail_call_args = deploy_mock.call_args_list[-1][0]
     assert tail_call_args[0] == pod.name + '-tail'
 
 
+def test_start_closes_started_shards_on_failure(mocker):
+    pod = get_k8s_pod('executor', 'ns', '3')
+
+    def _deploy(name, **kwargs):
+        if name in {pod.name + '-1', pod.name + '-2'}:
+            raise RuntimeError(name)
+
+    mocker.patch(
+        'jina.peapods.pods.k8slib.kubernetes_deployment.deploy_service',
+        side_effect=_deploy,
+    )
+    delete_mock = mocker.patch(
+        'jina.peapods.pods.k8s.K8sPod._K8sDeployment._delete_namespaced_deployment',
+        return_value=client.V1Status(status='Success'),
+    )
+
+    with pytest.raises(RuntimeError, match=pod.name + '-1'):
+        with pod:
+            pass
+
+    # the head and the only shard that started, the tail is never deployed
+    assert delete_mock.call_count == 2
+
+
 @pytest.mark.parametrize(
     'needs, replicas, expected_calls, expected_executors',
     [
@@ -480,12 +540,17 @@ def test_pod_wait_for_success(all_replicas_ready, mocker, caplog):
             ),
         )  # all ready
     else:
+        not_ready = client.V1Deployment(
+            status=client.V1DeploymentStatus(replicas=3, ready_replicas=1)
+        )
         mocker.patch(
             'jina.peapods.pods.k8s.K8sPod._K8sDeployment._read_namespaced_deployment',
-            return_value=client.V1Deployment(
-                status=client.V1DeploymentStatus(replicas=3, ready_replicas=1)
-            ),
+            return_value=not_ready,
         )  # not all peas ready
+        mocker.patch(
+            'jina.peapods.pods.k8s.K8sPod._K8sDeployment._watch_namespaced_deployment',
+            return_value=[{'type': 'MODIFIED', 'object': not_ready}],
+        )  # and no update makes them ready
     args = set_pod_parser().parse_args(args_list)
     mocker.patch(
         'jina.peapods.pods.k8slib.kubernetes_deployment.deploy_service',
@@ -506,6 +571,151 @@ def test_pod_wait_for_success(all_replicas_ready, mocker, caplog):
                 pass
 
 
+def _get_k8s_deployment(timeout_ready: str = '10000') -> K8sPod._K8sDeployment:
+    args = set_pod_parser().parse_args(
+        [
+            '--name',
+            'test-wait-success',
+            '--k8s-namespace',
+            'test-namespace',
+            '--replicas',
+            '3',
+            '--timeout-ready',
+            timeout_ready,
+        ]
+    )
+    return K8sPod(args).k8s_deployments[0]
+
+
+def _deployment_status(**kwargs) -> client.V1Deployment:
+    return client.V1Deployment(status=client.V1DeploymentStatus(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_deployment_wait_restart_success(mocker):
+    deployment = _get_k8s_deployment()
+    mocker.patch.object(
+        deployment,
+        '_read_namespaced_deployment',
+        return_value=_deployment_status(replicas=4, updated_replicas=1),
+    )
+    mocker.patch.object(
+        deployment,
+        '_watch_namespaced_deployment',
+        return_value=[
+            {
+                'type': 'MODIFIED',
+                'object': _deployment_status(replicas=3, updated_replicas=3),
+            }
+        ],
+    )
+    get_pod_uids = mocker.patch.object(
+        deployment, 'get_pod_uids', return_value=['new-0', 'new-1', 'new-2']
+    )
+
+    await deployment.wait_restart_success(['old-0', 'old-1', 'old-2'])
+    get_pod_uids.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_deployment_wait_restart_old_pods_terminating(mocker):
+    deployment = _get_k8s_deployment()
+    mocker.patch.object(
+        deployment,
+        '_read_namespaced_deployment',
+        return_value=_deployment_status(replicas=3, updated_replicas=3),
+    )
+    # the deployment is updated, but an old Pod is still terminating on the first poll
+    get_pod_uids = mocker.patch.object(
+        deployment,
+        'get_pod_uids',
+        side_effect=[['old-0', 'new-0', 'new-1', 'new-2'], ['new-0', 'new-1', 'new-2']],
+    )
+
+    await deployment.wait_restart_success(['old-0'])
+    assert get_pod_uids.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_deployment_wait_scale_success(mocker):
+    deployment = _get_k8s_deployment()
+    mocker.patch.object(
+        deployment,
+        '_read_namespaced_deployment',
+        return_value=_deployment_status(replicas=5, ready_replicas=3),
+    )
+    mocker.patch.object(
+        deployment,
+        '_watch_namespaced_deployment',
+        return_value=[
+            {
+                'type': 'MODIFIED',
+                'object': _deployment_status(replicas=5, ready_replicas=4),
+            },
+            {
+                'type': 'MODIFIED',
+                'object': _deployment_status(replicas=5, ready_replicas=5),
+            },
+        ],
+    )
+
+    await deployment.wait_scale_success(5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('wait', ['restart', 'scale'])
+async def test_deployment_wait_not_ready(wait, mocker):
+    deployment = _get_k8s_deployment(timeout_ready='100')
+    not_ready = _deployment_status(replicas=4, updated_replicas=1, ready_replicas=1)
+    mocker.patch.object(
+        deployment, '_read_namespaced_deployment', return_value=not_ready
+    )
+    # no update makes it ready, the stream ends at the deadline
+    mocker.patch.object(
+        deployment,
+        '_watch_namespaced_deployment',
+        return_value=[{'type': 'MODIFIED', 'object': not_ready}],
+    )
+
+    with pytest.raises(jina.excepts.RuntimeFailToStart):
+        if wait == 'restart':
+            await deployment.wait_restart_success(['old-0'])
+        else:
+            await deployment.wait_scale_success(5)
+
+
+@pytest.mark.asyncio
+async def test_deployment_wait_restart_old_pods_never_terminate(mocker):
+    deployment = _get_k8s_deployment(timeout_ready='100')
+    mocker.patch.object(
+        deployment,
+        '_read_namespaced_deployment',
+        return_value=_deployment_status(replicas=3, updated_replicas=3),
+    )
+    # the deployment is updated, only the deadline of `wait_for` stops polling the Pods
+    mocker.patch.object(deployment, 'get_pod_uids', return_value=['old-0'])
+
+    with pytest.raises(jina.excepts.RuntimeFailToStart):
+        await deployment.wait_restart_success(['old-0'])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('wait', ['restart', 'scale'])
+async def test_deployment_wait_api_exception(wait, mocker):
+    deployment = _get_k8s_deployment()
+    mocker.patch.object(
+        deployment,
+        '_read_namespaced_deployment',
+        side_effect=client.ApiException(status=500, reason='Internal Server Error'),
+    )
+
+    with pytest.raises(jina.excepts.RuntimeFailToStart, match='ApiException'):
+        if wait == 'restart':
+            await deployment.wait_restart_success(['old-0'])
+        else:
+            await deployment.wait_scale_success(5)
+
+
 def test_pod_with_gpus(mocker):
     args_list = [
         '--name',
@@ -1,6 +1,7 @@
 import json
 import os
 import subprocess
+import sys
 
 import pytest
 
@@ -9,7 +10,7 @@ from cli.export import api_to_dict
 from cli.lookup import _build_lookup_table, lookup_and_print
 from jina.checker import NetworkChecker
 from jina.jaml import JAML
-from jina.parsers import set_pod_parser, set_pea_parser
+from jina.parsers import get_main_parser, set_pod_parser, set_pea_parser
 from jina.parsers.ping import set_ping_parser
 from jina.peapods import Pea
 
@@ -35,6 +36,43 @@ def test_main_cli():
     subprocess.check_call(['jina'])
 
 
+def test_main_cli_quick_help():
+    sub_commands = get_main_parser()._actions[-1].choices
+    out = subprocess.check_output(['jina']).decode()
+    assert all(cli in out for cli in sub_commands)
+    # the quick help lists the sub-commands of the autocomplete table
+    assert set(sub_commands) == set(ac_table['commands']) - {
+        '--help',
+        '--version',
+        '--version-full',
+    }
+
+
+def test_cli_import_is_light():
+    out = subprocess.check_output(
+        [sys.executable, '-c', 'import sys, cli; print(" ".join(sys.modules))']
+    )
+    heavy = {'jina', 'numpy', 'grpc', 'pkg_resources', 'tensorflow', 'torch'}
+    assert not heavy.intersection(out.decode().split())
+
+    # bare `jina` prints the quick help and exits without importing `jina` either
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            '-c',
+            'import contextlib, io, sys, cli\n'
+            'sys.argv = ["jina"]\n'
+            'with contextlib.redirect_stdout(io.StringIO()):\n'
+            '    try:\n'
+            '        cli.main()\n'
+            '    except SystemExit:\n'
+            '        pass\n'
+            'print(" ".join(sys.modules))',
+        ]
+    )
+    assert not heavy.intersection(out.decode().split())
+
+
 def test_cli_help():
     subprocess.check_call(['jina', 'help', 'pod'])
 